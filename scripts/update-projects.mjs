@@ -1,4 +1,6 @@
-import { writeFile } from "node:fs/promises";
+import { readFile, writeFile } from "node:fs/promises";
+
+const CACHE_FILE = ".gh_cache.json";
 
 const repos = [
   ["vladkens/twscrape", "Python library for scraping X"],
@@ -11,26 +13,68 @@ const repos = [
   ["vladkens/badges", "Nice badges for your projects"],
 ];
 
-const fetchRepo = async (repo) => {
-  const response = await fetch(`https://api.github.com/repos/${repo}`);
+const isPlainObject = (x) => typeof x === "object" && x !== null && !Array.isArray(x);
+
+const loadCache = async () => {
+  try {
+    const cache = JSON.parse(await readFile(CACHE_FILE, "utf8"));
+    return isPlainObject(cache) ? cache : {};
+  } catch {
+    return {};
+  }
+};
+
+// Conditional request: GitHub answers 304 without a body when the ETag still matches.
+// With a token (GITHUB_TOKEN) such 304 answers also don't count against the rate limit.
+const fetchRepo = async (repo, cache) => {
+  const url = `https://api.github.com/repos/${repo}`;
+  const cached = cache[url];
+  const hasCached = typeof cached?.etag === "string" && isPlainObject(cached.data);
+
+  const headers = {};
+  if (process.env.GITHUB_TOKEN) headers["Authorization"] = `Bearer ${process.env.GITHUB_TOKEN}`;
+  if (hasCached) headers["If-None-Match"] = cached.etag;
+
+  const response = await fetch(url, { headers });
+  if (response.status === 304 && hasCached) return cached.data;
   if (!response.ok) {
     throw new Error(
       `GitHub API request failed for ${repo}: ${response.status} ${response.statusText}`,
     );
   }
 
-  return response.json();
+  const { description, language, stargazers_count } = await response.json();
+  const data = { description, language, stargazers_count };
+  const etag = response.headers.get("etag");
+  if (etag) cache[url] = { etag, data };
+  return data;
+};
+
+// Like JSON.stringify(items, null, 2): undefined fields are dropped and an empty list is `[]`,
+// but arrays ("langs") stay on one line
+const formatValue = (value) => {
+  if (!Array.isArray(value)) return JSON.stringify(value);
+  return `[${value.map((x) => JSON.stringify(x) ?? "null").join(", ")}]`;
 };
 
 const formatItems = (items) => {
-  const raw = JSON.stringify(items, null, 2);
-  return raw.replace(/\[\n\s+"/g, '["').replace(/"\n\s+\]/g, '"]') + "\n";
+  if (items.length === 0) return "[]\n";
+
+  const objects = items.map((item) => {
+    const fields = Object.entries(item)
+      .filter(([, v]) => v !== undefined)
+      .map(([k, v]) => `    ${JSON.stringify(k)}: ${formatValue(v)}`);
+    return `  {\n${fields.join(",\n")}\n  }`;
+  });
+
+  return `[\n${objects.join(",\n")}\n]\n`;
 };
 
 try {
+  const cache = await loadCache();
   const items = await Promise.all(
     repos.map(async ([repo, descr]) => {
-      const data = await fetchRepo(repo);
+      const data = await fetchRepo(repo, cache);
       return {
         name: repo,
         descr: descr || data.description,
@@ -42,6 +86,7 @@ try {
 
   items.sort((a, b) => b.stars - a.stars);
   await writeFile("projects.json", formatItems(items));
+  await writeFile(CACHE_FILE, JSON.stringify(cache));
 } catch (error) {
   console.error(error.message);
   process.exit(1);